@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Integer, BigInteger, DateTime, func
+from sqlalchemy import String, Integer, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database.session import Base
@@ -18,7 +18,7 @@ class Car(Base):
         price_usd (int): The price of the car in US dollars.
         odometer (int): The distance the car has traveled (mileage).
         username (str): The name of the seller or user who posted the ad.
-        phone_number (int): The contact phone number (stored as BigInteger).
+        phone_number (str): The contact phone number in `380...` format.
         image_url (str): The URL to the main image of the car.
         images_count (int): The total number of images available in the listing.
         car_number (str): The license plate number of the car.
@@ -28,6 +28,7 @@ class Car(Base):
     """
 
     __tablename__ = "cars"
+    __table_args__ = (Index("ix_cars_datetime_found", "datetime_found"),)
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     url: Mapped[str] = mapped_column(String, unique=True, index=True)
@@ -35,7 +36,7 @@ class Car(Base):
     price_usd: Mapped[int] = mapped_column(Integer, nullable=True)
     odometer: Mapped[int] = mapped_column(Integer, nullable=True)
     username: Mapped[str] = mapped_column(String, nullable=True)
-    phone_number: Mapped[int] = mapped_column(BigInteger, nullable=True)
+    phone_number: Mapped[str] = mapped_column(String(15), nullable=True)
     image_url: Mapped[str] = mapped_column(String, nullable=True)
     images_count: Mapped[int] = mapped_column(Integer, nullable=True)
     car_number: Mapped[str] = mapped_column(String, nullable=True)
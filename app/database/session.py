@@ -4,11 +4,22 @@ from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
-from core.config import settings
-
-
-# Create the asynchronous engine using the URL from settings
-engine = create_async_engine(settings.DATABASE_URL, echo=False, future=True)
+from core.config import get_settings
+
+
+# Create the asynchronous engine using the URL from settings.
+# The pool lives for the whole process and is reused by every scheduled run:
+# connections are checked before use and recycled before the server or any
+# proxy drops them as idle.
+engine = create_async_engine(
+    get_settings().DATABASE_URL,
+    echo=False,
+    future=True,
+    pool_size=5,
+    max_overflow=0,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 
 # Create a session factory for creating AsyncSession instances
 AsyncSessionLocal = async_sessionmaker(
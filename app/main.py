@@ -1,9 +1,13 @@
 import asyncio
+from typing import Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from loguru import logger
+from playwright.async_api import async_playwright, Browser, Playwright
 from pytz import timezone
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from core.config import settings
+from core.config import get_settings
 from database.session import async_session, engine, Base
 from services.scraper import AutoRiaScraper
 from services.backup import PostgresBackupService
@@ -18,6 +22,8 @@ class ScraperApplication:
     Attributes:
         scheduler (AsyncIOScheduler): The scheduler instance for running periodic tasks.
         stop_event (asyncio.Event): Event to signal application shutdown.
+        playwright (Optional[Playwright]): The running Playwright driver.
+        browser (Optional[Browser]): The Chromium instance shared by all scraper runs.
     """
 
     def __init__(self):
@@ -28,18 +34,82 @@ class ScraperApplication:
         """
         self.scheduler = AsyncIOScheduler(timezone=timezone("Europe/Kyiv"))
         self.stop_event = asyncio.Event()
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
 
     async def _init_database(self):
         """Initializes database tables.
 
         Checks for the existence of tables defined in SQLAlchemy models and creates
-        them if they are missing using the asynchronous engine.
+        them if they are missing using the asynchronous engine, then upgrades
+        tables created by older versions of the application.
         """
         logger.info("🏗️ Checking database tables...")
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await self._upgrade_database(conn)
         logger.info("✅ Database tables verified/created.")
 
+    @staticmethod
+    async def _upgrade_database(conn: AsyncConnection):
+        """Applies schema changes that `create_all` does not make to existing tables.
+
+        Converts `cars.phone_number` from BIGINT to VARCHAR(15) and adds the
+        `datetime_found` index. Both steps are idempotent.
+
+        Args:
+            conn (AsyncConnection): A connection inside an open transaction.
+        """
+        phone_type = await conn.scalar(
+            text(
+                "SELECT data_type FROM information_schema.columns "
+                "WHERE table_schema = current_schema() "
+                "AND table_name = 'cars' AND column_name = 'phone_number'"
+            )
+        )
+        if phone_type == "bigint":
+            logger.info("Converting cars.phone_number to varchar(15)...")
+            await conn.execute(
+                text(
+                    "ALTER TABLE cars ALTER COLUMN phone_number "
+                    "TYPE varchar(15) USING phone_number::text"
+                )
+            )
+
+        await conn.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_cars_datetime_found ON cars (datetime_found)")
+        )
+
+    async def _init_browser(self):
+        """Launches the headless Chromium browser shared by all scraper runs.
+
+        Starts Playwright on first use and (re)launches the browser if it has
+        not been started yet or has disconnected since the last run.
+        """
+        if self.browser and self.browser.is_connected():
+            return
+
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+
+        logger.info("🌐 Launching browser...")
+        self.browser = await self.playwright.chromium.launch(headless=True)
+
+    async def _close_browser(self):
+        """Closes the shared browser and stops Playwright.
+
+        Playwright is stopped even if closing the browser fails, so the driver
+        process is not leaked.
+        """
+        try:
+            if self.browser:
+                await self.browser.close()
+        finally:
+            self.browser = None
+            if self.playwright:
+                await self.playwright.stop()
+                self.playwright = None
+
     async def scheduled_job(self):
         """The main task executed by the scheduler.
 
@@ -49,14 +119,15 @@ class ScraperApplication:
         logger.info("⏰ Scheduler triggered scraper job")
 
         try:
+            await self._init_browser()
             async with async_session() as db:
-                scraper = AutoRiaScraper(db)
+                scraper = AutoRiaScraper(db, browser=self.browser)
                 await scraper.run()
         except Exception as e:
             logger.error(f"Scraper job failed: {e}")
 
         try:
-            backup_service = PostgresBackupService(settings.SYNC_DATABASE_URL)
+            backup_service = PostgresBackupService(get_settings().SYNC_DATABASE_URL)
             backup_service.create_dump()
         except Exception as e:
             logger.error(f"Scheduled backup failed: {e}")
@@ -67,6 +138,7 @@ class ScraperApplication:
         Schedules the 'scheduled_job' to run daily at the time specified in
         the configuration settings (RUN_TIME_HOUR:RUN_TIME_MINUTE).
         """
+        settings = get_settings()
         self.scheduler.add_job(
             self.scheduled_job,
             "cron",
@@ -83,10 +155,15 @@ class ScraperApplication:
 
         Orchestrates the startup sequence:
         1. Initializes the database.
-        2. Starts the scheduler.
-        3. Keeps the application running until a stop signal is received.
+        2. Launches the browser (retried by each job if it fails here).
+        3. Starts the scheduler.
+        4. Keeps the application running until a stop signal is received.
         """
         await self._init_database()
+        try:
+            await self._init_browser()
+        except Exception as e:
+            logger.error(f"Browser launch failed, will retry on the next job: {e}")
         self.start_scheduler()
 
         try:
@@ -95,6 +172,7 @@ class ScraperApplication:
             logger.info("🛑 Application stopping...")
         finally:
             self.scheduler.shutdown()
+            await self._close_browser()
             logger.info("👋 Application shutdown complete.")
 
 
@@ -1,52 +1,111 @@
+import glob
 import os
 import subprocess
 from datetime import datetime
+from urllib.parse import urlsplit, unquote
 from loguru import logger
 
 
 class PostgresBackupService:
     """Handles database backup creation.
 
-    This service executes shell commands to generate SQL dumps of the database
-    using the pg_dump utility.
+    This service runs the pg_dump utility to generate compressed custom-format
+    dumps of the database. Credentials are passed through the environment
+    rather than the command line.
 
     Attributes:
         db_url (str): The PostgreSQL connection URL.
         backup_dir (str): The directory path where backup files are stored.
+        keep (int): The number of most recent dumps to retain.
     """
 
-    def __init__(self, db_url: str, backup_dir: str = "dumps"):
+    def __init__(self, db_url: str, backup_dir: str = "dumps", keep: int = 7):
         """Initializes the backup service.
 
         Args:
             db_url (str): The connection string for the PostgreSQL database.
             backup_dir (str, optional): Directory to store dumps. Defaults to "dumps".
+            keep (int, optional): Number of most recent dumps to keep; older ones
+                are deleted after each successful backup. Defaults to 7.
+
+        Raises:
+            ValueError: If `keep` is less than 1.
         """
+        if keep < 1:
+            raise ValueError(f"keep must be at least 1, got {keep}")
+
         self.db_url = db_url
         self.backup_dir = backup_dir
+        self.keep = keep
 
         os.makedirs(self.backup_dir, exist_ok=True)
 
+    def _pg_env(self) -> dict[str, str]:
+        """Builds the libpq environment for pg_dump from the connection URL.
+
+        Returns:
+            dict[str, str]: A copy of the current environment extended with the
+            PGHOST, PGPORT, PGUSER, PGPASSWORD and PGDATABASE variables.
+        """
+        url = urlsplit(self.db_url)
+        env = os.environ.copy()
+        env.update(
+            {
+                "PGHOST": url.hostname or "",
+                "PGPORT": str(url.port or 5432),
+                "PGUSER": unquote(url.username or ""),
+                "PGPASSWORD": unquote(url.password or ""),
+                "PGDATABASE": unquote(url.path.lstrip("/")),
+            }
+        )
+        return env
+
     def create_dump(self) -> None:
         """Generates a new database dump using pg_dump.
 
-        Constructs a timestamped filename and executes the pg_dump command via
-        a subprocess.
+        Constructs a timestamped filename and runs pg_dump directly (without a
+        shell), writing a compressed custom-format archive that can be restored
+        with pg_restore. The archive is written under a temporary name and only
+        renamed to `backup_*.dump` on success, so failed or interrupted runs
+        never count towards retention. Old dumps are pruned once the new one
+        is in place.
 
         Raises:
             subprocess.CalledProcessError: If the pg_dump command fails.
         """
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"backup_{timestamp}.sql"
+        filename = f"backup_{timestamp}.dump"
         filepath = os.path.join(self.backup_dir, filename)
 
         logger.info(f"Starting database backup: {filename}")
 
-        command = f"pg_dump {self.db_url} > {filepath}"
+        partial_filepath = f"{filepath}.part"
+        command = ["pg_dump", "-Fc", "-Z", "6", "-f", partial_filepath]
 
         try:
-            subprocess.run(command, shell=True, check=True)
+            subprocess.run(command, check=True, env=self._pg_env())
+            os.replace(partial_filepath, filepath)
             logger.info(f"Backup created successfully: {filepath}")
         except subprocess.CalledProcessError as e:
             logger.error(f"Error, backup failed: {e}")
             raise e
+        finally:
+            if os.path.exists(partial_filepath):
+                os.remove(partial_filepath)
+
+        self._prune_old_dumps()
+
+    def _prune_old_dumps(self) -> None:
+        """Deletes all but the `self.keep` most recent dumps.
+
+        Dump filenames embed a sortable timestamp, so lexical order is
+        chronological order.
+        """
+        dumps = sorted(glob.glob(os.path.join(self.backup_dir, "backup_*.dump")))
+
+        for filepath in dumps[: -self.keep]:
+            try:
+                os.remove(filepath)
+                logger.info(f"Removed old backup: {filepath}")
+            except OSError as e:
+                logger.warning(f"Could not remove old backup {filepath}: {e}")
@@ -1,85 +1,297 @@
 import asyncio
 import random
 import re
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List
 
 from loguru import logger
-from playwright.async_api import async_playwright, Page, BrowserContext
+from playwright.async_api import Browser, Page, BrowserContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from core.config import settings
+from core.config import get_settings
 from database.models import Car
 from zoneinfo import ZoneInfo
 
+_PHOTO_COUNT = re.compile(r"(\d+)$")
+_AUTO_ID = re.compile(r"_(\d+)\.html")
+
+# URL patterns for resources never needed for scraping (images, media, fonts).
+# Stylesheets are still loaded because the VIN, plate and phone popup checks
+# depend on computed visibility.
+_BLOCKED_URL_PATTERNS = [
+    f"*.{extension}*"
+    for extension in (
+        "jpg", "jpeg", "png", "gif", "webp", "avif", "svg",
+        "mp4", "webm", "m3u8",
+        "woff", "woff2", "ttf", "otf", "eot",
+    )
+]
+
+
+def _digits(text: str) -> str:
+    """Keeps only the decimal digits of a string.
+
+    Equivalent to `re.sub(r"\\D", "", text)` but done in a single C-level pass.
+
+    Args:
+        text (str): The raw string.
+
+    Returns:
+        str: The digits of `text` in their original order.
+    """
+    return "".join(filter(str.isdecimal, text))
+
+
+async def _block_heavy_resources(page: Page) -> None:
+    """Makes Chromium drop image, media and font requests for a page.
+
+    Uses the DevTools `Network.setBlockedURLs` command instead of request
+    interception, so requests are filtered inside the browser without a Python
+    round-trip and the HTTP cache stays enabled.
+
+    Args:
+        page (Page): The page to apply the blocklist to.
+    """
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send("Network.enable")
+    await cdp.send("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+
+
+# Collects car links and the next-page URL of a catalog page in one round-trip
+_CATALOG_JS = """
+() => {
+    const next = document.querySelector("a.page-link.js-next");
+    const nextVisible = next && next.getClientRects().length && getComputedStyle(next).visibility !== "hidden";
+    return {
+        links: Array.from(document.querySelectorAll("a.m-link-ticket"), (el) => el.href),
+        next: nextVisible ? next.href : null,
+    };
+}
+"""
+
+# Gallery counter ("1 of 19") that the carousel renders on the client
+_PHOTO_COUNT_SELECTOR = '#photoSlider .carousel__liveregion[aria-live="polite"]'
+
+# Collects every listing field in a single browser round-trip
+_CAR_DATA_JS = """
+(photoCountSelector) => {
+    const text = (selector) => document.querySelector(selector)?.textContent ?? null;
+    const visibleText = (selector) => {
+        const el = document.querySelector(selector);
+        if (!el || !el.getClientRects().length || getComputedStyle(el).visibility === "hidden") {
+            return null;
+        }
+        return el.textContent;
+    };
+    return {
+        autoId: text("#advertStatisticID .titleS"),
+        title: text("#basicInfoTitle"),
+        price: text("#basicInfoPrice .titleL"),
+        odometer: text("#basicInfoTableMainInfo0 span"),
+        username: text("#sellerInfoUserName .titleM"),
+        vin: visibleText("#badgesVin span.badge"),
+        plate: visibleText("div.car-number span.common-text"),
+        image: document.querySelector("div.carousel__viewport img")?.getAttribute("src") ?? null,
+        photoCount: text(photoCountSelector),
+    };
+}
+"""
+
+# Clicks 'Show Phone' and resolves with the popup text once it becomes visible,
+# or with null if the button is missing or the popup does not show up in time
+_PHONE_JS = """
+(timeout) => new Promise((resolve) => {
+    const button = document.querySelector("#sellerInfo div.button-main button[data-action='showBottomPopUp']");
+    if (!button) {
+        resolve(null);
+        return;
+    }
+    const findPhone = () => {
+        const el = document.querySelector("#autoPhonePopUpResponse div.button-main span.common-text");
+        return el && el.getClientRects().length && getComputedStyle(el).visibility !== "hidden" ? el : null;
+    };
+    const observer = new MutationObserver(() => {
+        const el = findPhone();
+        if (el) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(el.textContent);
+        }
+    });
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(null);
+    }, timeout);
+    observer.observe(document.body, { subtree: true, childList: true, attributes: true, characterData: true });
+    button.click();
+    // The popup may already be visible, or become visible without a mutation
+    const el = findPhone();
+    if (el) {
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(el.textContent);
+    }
+})
+"""
+
+
 class AutoRiaScraper:
     """Main Scraper Service for AutoRia.
 
     Responsible for collecting car data from AutoRia listings and persisting
-    it to a PostgreSQL database. Implements concurrency control via semaphores,
-    browser context management, and robust error handling.
+    it to a PostgreSQL database. Implements concurrency control via a fixed
+    pool of reusable browser pages, browser context management, and robust
+    error handling.
 
     Attributes:
         db (AsyncSession): The SQLAlchemy async session for database operations.
+        browser (Browser): A running Playwright browser owned by the caller.
         context (Optional[BrowserContext]): The Playwright browser context.
-        semaphore (asyncio.Semaphore): Concurrency limiter for scraping tasks.
+        semaphore_limit (int): Number of pages kept in the page pool.
+        pages (asyncio.Queue[Page]): Pool of idle pages; also limits concurrency.
+        url_queue (asyncio.Queue[Optional[str]]): Car URLs waiting to be scraped,
+            bounded to twice the number of workers. A `None` item tells a
+            worker to stop.
+        workers (List[asyncio.Task]): The running scraping worker tasks.
+        batch_size (int): Maximum number of cars persisted per database round-trip.
+        fresh_for (timedelta): Listings saved more recently than this are not
+            scraped again.
     """
 
-    def __init__(self, db: AsyncSession, semaphore_limit: int = 3):
+    def __init__(
+        self,
+        db: AsyncSession,
+        browser: Browser,
+        semaphore_limit: int = 3,
+        batch_size: int = 50,
+        fresh_for: timedelta = timedelta(hours=20),
+    ):
         """Initializes the scraper with a database session and concurrency controls.
 
         Args:
             db (AsyncSession): An active asynchronous SQLAlchemy session.
+            browser (Browser): A launched browser. The scraper opens its own
+                context in it but never closes the browser itself.
             semaphore_limit (int, optional): The maximum number of concurrent
                 scraping tasks (browser tabs) allowed. Defaults to 3.
+            batch_size (int, optional): The maximum number of cars saved per
+                UPSERT statement and commit. Defaults to 50.
+            fresh_for (timedelta, optional): How long a saved listing is
+                considered up to date. Must be shorter than the interval
+                between scheduled runs, or listings are only refreshed every
+                other run. Defaults to 20 hours (runs are daily).
         """
         self.db = db
+        self.browser = browser
+        self.batch_size = batch_size
+        self.fresh_for = fresh_for
         self.context: Optional[BrowserContext] = None
-        self.semaphore = asyncio.Semaphore(semaphore_limit)
+        self.semaphore_limit = semaphore_limit
+        self.pages: asyncio.Queue[Page] = asyncio.Queue()
+        self.url_queue: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=2 * semaphore_limit)
+        self.workers: List[asyncio.Task] = []
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._db_lock = asyncio.Lock()
 
     async def run(self):
         """Executes the main scraping workflow.
 
-        Launches the Playwright browser, sets up the context with a realistic
-        User-Agent, and initiates the catalog crawling process. Handles the
-        browser lifecycle (launching and closing) and logs critical stages.
+        Sets up a fresh browser context with a realistic User-Agent, starts the
+        scraping workers and initiates the catalog crawling process. Handles
+        the context lifecycle (creating and closing) and logs critical stages.
         """
-        logger.info(f"🚀 Starting scraper from URL: {settings.START_URL}")
+        logger.info(f"🚀 Starting scraper from URL: {get_settings().START_URL}")
+
+        self.context = await self.browser.new_context(
+            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            viewport={"width": 1920, "height": 1080},
+        )
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+        try:
+            page = await self._new_page()
 
-            self.context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                viewport={"width": 1920, "height": 1080},
-            )
+            for _ in range(self.semaphore_limit):
+                await self.pages.put(await self._new_page())
 
-            page = await self.context.new_page()
+            self.workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.semaphore_limit)
+            ]
 
             try:
                 await self._get_cars_urls(page)
             except Exception as e:
                 logger.error(f"Critical scraper error: {e}")
             finally:
-                await browser.close()
-                logger.info("Scraper finished execution.")
+                await self._stop_workers()
+                await self._flush_rows()
+        finally:
+            await self.context.close()
+            logger.info("Scraper finished execution.")
+
+    async def _new_page(self) -> Page:
+        """Opens a page in the current context with heavy resources blocked.
 
-    async def _get_cars_urls(self, page: Page) -> list[str]:
+        Returns:
+            Page: The new page.
+        """
+        page = await self.context.new_page()
+        await _block_heavy_resources(page)
+        return page
+
+    async def _enqueue(self, item: Optional[str]) -> bool:
+        """Puts an item on `self.url_queue` while at least one worker is alive.
+
+        The queue is bounded, so a plain `put` would block forever once every
+        worker has stopped.
+
+        Args:
+            item (Optional[str]): A car URL, or `None` to stop a worker.
+
+        Returns:
+            bool: True if the item was queued, False if all workers have stopped.
+        """
+        put = asyncio.ensure_future(self.url_queue.put(item))
+        try:
+            while True:
+                alive = [worker for worker in self.workers if not worker.done()]
+                if not alive:
+                    return False
+                await asyncio.wait([put, *alive], return_when=asyncio.FIRST_COMPLETED)
+                if put.done():
+                    return True
+        finally:
+            if not put.done():
+                put.cancel()
+
+    async def _stop_workers(self):
+        """Sends one `None` sentinel per worker and waits for all of them to exit.
+
+        Worker failures are logged instead of propagated so the remaining
+        buffered rows are still flushed.
+        """
+        for _ in self.workers:
+            if not await self._enqueue(None):
+                break
+
+        results = await asyncio.gather(*self.workers, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Scraping worker failed: {result}")
+
+    async def _get_cars_urls(self, page: Page) -> None:
         """Iterates through all pagination pages to collect car links.
 
         Navigates through the catalog starting from the configured start URL.
-        On each page, it extracts car links and spawns asynchronous tasks to
-        scrape details for each car, respecting the semaphore limits.
+        On each page, it extracts car links and enqueues them for the scraping
+        workers, then moves on to the next page without waiting for the
+        details to be scraped.
 
         Args:
             page (Page): The Playwright page object used for navigation.
-
-        Returns:
-            list[str]: A list of collected car URLs (used internally).
         """
-        current_url = settings.START_URL
+        current_url = get_settings().START_URL
        
         while True:
             logger.info(f"Processing catalog page: {current_url}")
@@ -90,11 +302,10 @@ class AutoRiaScraper:
                 logger.error(f"Failed to load catalog: {e}")
                 break
 
-            links_locators = await page.locator("a.m-link-ticket").all()
+            catalog = await page.evaluate(_CATALOG_JS)
 
             car_links = []
-            for link in links_locators:
-                href = await link.get_attribute("href")
+            for href in catalog["links"]:
                 # Ignore new cars
                 if href and "/newauto/" not in href:
                     car_links.append(href)
@@ -103,58 +314,160 @@ class AutoRiaScraper:
 
             logger.info(f"Found {len(car_links)} cars on the current page.")
 
-            # Async processing of car links
-            tasks = [self._safe_get_car_data(link) for link in car_links]
-            await asyncio.gather(*tasks)
+            fresh_links = await self._get_fresh_urls(car_links)
+            if fresh_links:
+                logger.info(f"Skipping {len(fresh_links)} recently scraped cars.")
 
-            # Sync processing of car links
-            # for link in car_links:
-            #     await self._get_car_data(link)
-            #     asyncio.sleep(random.uniform(5, 15))
+            # Hand the links over to the scraping workers
+            for link in dict.fromkeys(car_links):
+                if link in fresh_links:
+                    continue
+                if not await self._enqueue(link):
+                    raise RuntimeError("All scraping workers have stopped.")
 
-            next_page_btn = page.locator("a.page-link.js-next")
-
-            if await next_page_btn.is_visible():
-                current_url = await next_page_btn.get_attribute("href")
+            if catalog["next"]:
+                current_url = catalog["next"]
                 logger.info("Navigating to the next page...")
             else:
                 logger.info("Reached the last page.")
                 break
 
-    async def _safe_get_car_data(self, link: str):
-        """Wrapper to scrape car data respecting the concurrency semaphore.
+    async def _get_fresh_urls(self, links: List[str]) -> set[str]:
+        """Returns the subset of links already saved within `self.fresh_for`.
+
+        Args:
+            links (List[str]): Car URLs found on a catalog page.
+
+        Returns:
+            set[str]: URLs that do not need to be scraped again.
+        """
+        if not links:
+            return set()
+
+        threshold = datetime.now(ZoneInfo("Europe/Kyiv")) - self.fresh_for
+        stmt = select(Car.url).where(Car.url.in_(links), Car.datetime_found > threshold)
+
+        async with self._db_lock:
+            try:
+                result = await self.db.execute(stmt)
+            except Exception as e:
+                logger.warning(f"Could not check for recently scraped cars: {e}")
+                await self.db.rollback()
+                return set()
+        return set(result.scalars())
 
-        Ensures that the number of concurrent browser tabs/contexts does not
-        exceed the limit defined in `self.semaphore`.
+    async def _worker(self):
+        """Consumes car URLs from `self.url_queue` until a `None` sentinel arrives.
+
+        Raw scraped listings are buffered (keyed by URL, since a single
+        multi-row UPSERT cannot touch the same URL twice) and flushed to the
+        database once `self.batch_size` of them have accumulated.
+        """
+        while True:
+            link = await self.url_queue.get()
+            if link is None:
+                break
+
+            result = await self._safe_get_car_data(link)
+            if result:
+                self._results[result["url"]] = result
+                if len(self._results) >= self.batch_size:
+                    await self._flush_rows()
+
+    async def _flush_rows(self):
+        """Cleans all buffered listings and saves them as one batch.
+
+        Serialized with a lock because the workers share a single database
+        session. If the batch fails, it is rolled back and the rows are retried
+        one by one, so a single bad row only loses itself.
+        """
+        async with self._db_lock:
+            results = list(self._results.values())
+            self._results.clear()
+            rows = []
+            for result in results:
+                try:
+                    rows.append(self._build_row(result))
+                except Exception as e:
+                    logger.error(f"Error processing {result['url']}: {e}")
+
+            if not rows:
+                return
+
+            try:
+                await self._save_batch(rows)
+                return
+            except Exception as e:
+                logger.warning(f"Failed to save {len(rows)} cars as a batch, retrying one by one: {e}")
+                await self.db.rollback()
+
+            for row in rows:
+                try:
+                    await self._save_batch([row])
+                except Exception as e:
+                    logger.error(f"Failed to save car {row['url']}: {e}")
+                    await self.db.rollback()
+
+    async def _safe_get_car_data(self, link: str) -> Optional[Dict[str, Any]]:
+        """Wrapper to scrape car data on a page borrowed from the page pool.
+
+        Waiting for an idle page ensures that the number of concurrent browser
+        tabs does not exceed `self.semaphore_limit`. The page is reset to a
+        blank document before it is returned to the pool.
 
         Args:
             link (str): The URL of the specific car listing to scrape.
+
+        Returns:
+            Optional[Dict[str, Any]]: The raw scraped listing, or None on failure.
         """
-        async with self.semaphore:
-            await self._get_car_data(link)
+        page = await self.pages.get()
+        try:
+            return await self._get_car_data(page, link)
+        finally:
+            try:
+                await page.goto("about:blank")
+            except Exception as e:
+                logger.warning(f"Could not reset page after {link}: {e}")
+            await self.pages.put(page)
 
-    async def _get_car_data(self, link: str):
-        """Visits a single car page, scrapes data, and saves it to the DB.
+    async def _get_car_data(self, page: Page, link: str) -> Optional[Dict[str, Any]]:
+        """Visits a single car page and scrapes its data.
 
-        Opens a new page context, extracts fields (title, price, odometer, etc.),
-        handles the phone number popup, and saves the data to the database using
-        an upsert operation.
+        Extracts the raw field texts (title, price, odometer, etc.) with a
+        single `page.evaluate` call and handles the phone number popup.
+        Cleaning and persisting are left to the caller so that both can be done
+        for a whole batch at once (see `_build_row`).
 
         Args:
+            page (Page): A pooled page used to open the listing.
             link (str): The URL of the car listing.
+
+        Returns:
+            Optional[Dict[str, Any]]: A dict with the listing `url`,
+            `datetime_found` and the uncleaned `raw` field texts, or None if the
+            listing could not be processed.
         """
 
         await asyncio.sleep(random.uniform(3, 7))
 
-        page = await self.context.new_page()
         try:
             logger.debug(f"🔍 Scraping car: {link}")
             await page.goto(link, timeout=45000)
 
-            auto_id = await page.locator("#advertStatisticID .titleS").text_content()
+            # Parts of the listing are rendered on the client after `load`
+            await page.wait_for_selector("#basicInfoTitle", state="attached")
+            try:
+                await page.wait_for_selector(_PHOTO_COUNT_SELECTOR, state="attached", timeout=5000)
+            except Exception:
+                logger.debug(f"No photo gallery rendered for {link}")
+
+            raw = await page.evaluate(_CAR_DATA_JS, _PHOTO_COUNT_SELECTOR)
+
+            auto_id = raw["autoId"]
 
             if not auto_id:
-                match = re.search(r"_(\d+)\.html", link)
+                match = _AUTO_ID.search(link)
                 if match:
                     auto_id = match.group(1)
 
@@ -162,124 +475,99 @@ class AutoRiaScraper:
                 logger.warning(
                     f"WARNING: Could not determine auto_id for {link}. Skipping."
                 )
-                return
-
-            title = await page.locator("#basicInfoTitle").first.text_content()
-
-            price_text = await page.locator("#basicInfoPrice .titleL").text_content()
-            price_usd = self._clean_price(price_text)
-
-            odometer_text = await page.locator(
-                "#basicInfoTableMainInfo0 span"
-            ).first.text_content()
-            odometer = self._clean_odometer(odometer_text)
-
-            username = await page.locator(
-                "#sellerInfoUserName .titleM"
-            ).first.text_content()
-            username = username.strip() if username else "Unknown"
-
-            vin_locator = page.locator("#badgesVin span.badge")
-            car_vin = (
-                await vin_locator.text_content()
-                if await vin_locator.is_visible()
-                else None
-            )
-
-            plate_locator = page.locator("div.car-number span.common-text").first
-            car_number = (
-                await plate_locator.text_content()
-                if await plate_locator.is_visible()
-                else None
-            )
-
-            image_url = await page.locator(
-                "div.carousel__viewport img"
-            ).first.get_attribute("src")
+                return None
 
-            photo_count_text = await page.locator(
-                '#photoSlider .carousel__liveregion[aria-live="polite"]'
-            ).text_content()
-            images_count = self._clean_photo_count(photo_count_text)
+            if not raw["title"]:
+                logger.warning(f"WARNING: Could not find title for {link}. Skipping.")
+                return None
 
-            phone_number = await self._fetch_phone_number(page)
+            raw["phone"] = await self._fetch_phone_number(page)
 
-            car_data = {
+            result = {
                 "url": link,
-                "title": title.strip(),
-                "price_usd": price_usd,
-                "odometer": odometer,
-                "username": username,
-                "phone_number": phone_number,
-                "image_url": image_url,
-                "images_count": images_count,
-                "car_number": car_number.strip() if car_number else None,
-                "car_vin": car_vin.strip() if car_vin else None,
                 "datetime_found": datetime.now(ZoneInfo("Europe/Kyiv")),
+                "raw": raw,
             }
 
-            await self._save_to_db(car_data)
-            logger.debug(f"Scraped data: {car_data}")
+            logger.debug(f"Scraped data: {result}")
+            return result
 
         except Exception as e:
             logger.error(f"Error processing {link}: {e}")
-        finally:
-            await page.close()
+            return None
 
-    async def _fetch_phone_number(self, page: Page) -> Optional[int]:
+    async def _fetch_phone_number(self, page: Page) -> Optional[str]:
         """Attempts to retrieve the hidden phone number from the listing.
 
-        Simulates a click on the 'Show Phone' button and waits for the popup
-        to appear. Parses the resulting text to extract the number.
+        Clicks the 'Show Phone' button and waits for the popup to appear in a
+        single `page.evaluate` call.
 
         Args:
             page (Page): The current page object for the specific car listing.
 
         Returns:
-            Optional[int]: The cleaned phone number as an integer, or None if extraction fails.
+            Optional[str]: The raw popup text, or None if extraction fails.
         """
-        show_phone_button = page.locator(
-            "#sellerInfo div.button-main button[data-action='showBottomPopUp']"
-        )
-
         logger.debug("Attempting to click 'Show Phone' button")
         try:
-            if await show_phone_button.count() > 0:
-                await show_phone_button.first.click(timeout=5000)
-            else:
-                return None
+            return await page.evaluate(_PHONE_JS, 10000)
         except Exception as e:
-            logger.warning(f"Could not click 'Show Phone' button: {e}")
+            logger.warning(f"Could not fetch phone number: {e}")
             return None
 
-        popup_locator = page.locator(
-            "#autoPhonePopUpResponse div.button-main span.common-text"
-        ).first
-
-        await popup_locator.wait_for(state="visible", timeout=10000)
-
-        phone_text = await popup_locator.text_content()
-        phone_number = self._clean_phone(phone_text)
+    @classmethod
+    def _build_row(cls, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Turns a raw scraped listing into a database row.
 
-        return phone_number
+        Args:
+            result (Dict[str, Any]): A listing as returned by `_get_car_data`.
 
-    async def _save_to_db(self, data: Dict[str, Any]):
-        """Persists scraped car data to the database using an UPSERT operation.
+        Returns:
+            Dict[str, Any]: A row with cleaned values, ready for `_save_batch`.
+        """
+        raw = result["raw"]
+        return {
+            "url": result["url"],
+            "title": raw["title"].strip(),
+            "price_usd": cls._clean_price(raw["price"]),
+            "odometer": cls._clean_odometer(raw["odometer"]),
+            "username": raw["username"].strip() if raw["username"] else "Unknown",
+            "phone_number": cls._clean_phone(raw["phone"]),
+            "image_url": raw["image"],
+            "images_count": cls._clean_photo_count(raw["photoCount"]),
+            "car_number": raw["plate"].strip() if raw["plate"] else None,
+            "car_vin": raw["vin"].strip() if raw["vin"] else None,
+            "datetime_found": result["datetime_found"],
+        }
+
+    async def _save_batch(self, rows: List[Dict[str, Any]]):
+        """Persists a batch of scraped cars to the database using a single UPSERT.
 
         Uses PostgreSQL's `INSERT ... ON CONFLICT DO UPDATE` syntax to ensure
         records are updated if they already exist (based on the unique URL),
-        or inserted if they are new.
+        or inserted if they are new. The rows are passed as execute parameters
+        rather than rendered into the statement, so it is compiled once
+        regardless of the batch size. `RETURNING` is what makes SQLAlchemy use
+        its "insertmanyvalues" mode with asyncpg and send the rows as multi-row
+        VALUES pages; without it the driver would run one INSERT per row. The
+        whole batch is committed once.
 
         Args:
-            data (Dict[str, Any]): A dictionary containing the car attributes.
+            rows (List[Dict[str, Any]]): Dictionaries containing the car attributes.
         """
-        stmt = pg_insert(Car).values(**data)
+        if not rows:
+            return
 
-        do_update_stmt = stmt.on_conflict_do_update(index_elements=["url"], set_=data)
+        stmt = pg_insert(Car)
 
-        await self.db.execute(do_update_stmt)
+        do_update_stmt = stmt.on_conflict_do_update(
+            index_elements=["url"],
+            set_={column: stmt.excluded[column] for column in rows[0] if column != "url"},
+        ).returning(Car.id)
+
+        await self.db.execute(do_update_stmt, rows)
         await self.db.commit()
-        logger.info(f"Saved/Updated car: {data['title']}")
+        logger.info(f"Saved/Updated {len(rows)} cars.")
 
     @staticmethod
     def _clean_price(text: Optional[str]) -> Optional[int]:
@@ -293,7 +581,7 @@ class AutoRiaScraper:
         """
         if not text:
             return None
-        clean = re.sub(r"\D", "", text)
+        clean = _digits(text)
         return int(clean) if clean else None
 
     @staticmethod
@@ -309,7 +597,7 @@ class AutoRiaScraper:
         if not text:
             return None
         text = text.lower()
-        numbers = re.sub(r"\D", "", text)
+        numbers = _digits(text)
         if not numbers:
             return None
 
@@ -331,7 +619,7 @@ class AutoRiaScraper:
         if not text:
             return None
 
-        match = re.search(r"(\d+)$", text)
+        match = _PHOTO_COUNT.search(text)
 
         if match:
             photos_count_str = match.group(1)
@@ -343,20 +631,22 @@ class AutoRiaScraper:
         return None
 
     @staticmethod
-    def _clean_phone(text: str) -> Optional[int]:
-        """Normalizes phone number strings to a standard integer format.
+    def _clean_phone(text: str) -> Optional[str]:
+        """Normalizes phone number strings to a standard digits-only format.
 
         Removes non-digit characters and adds the country code (380) if missing.
+        Results longer than 15 digits (e.g. two numbers in one popup) do not fit
+        the `phone_number` column and are discarded.
 
         Args:
             text (str): The raw phone string (e.g., '(063) 213 44 11').
 
         Returns:
-            Optional[int]: The normalized phone number (e.g., 380632134411), or None.
+            Optional[str]: The normalized phone number (e.g., '380632134411'), or None.
         """
         if not text:
             return None
-        clean = re.sub(r"\D", "", text)
+        clean = _digits(text)
         if not clean:
             return None
 
@@ -365,4 +655,7 @@ class AutoRiaScraper:
         elif len(clean) == 9:
             clean = "380" + clean
 
-        return int(clean)
+        if len(clean) > 15:
+            return None
+
+        return clean